@@ -1,5 +1,4 @@
 import hido
-import json
 
 def header(text):
     print(f"\n{'='*50}\n{text}\n{'='*50}")
@@ -23,15 +22,14 @@ def main():
     # Resolve DID Document
     print("\nResolving DID Document...")
     doc = did_manager.resolve(did)
-    doc_json = json.loads(doc.to_json())
-    print(f"✅ Resolved Document: {json.dumps(doc_json, indent=2)}")
+    print(f"✅ Resolved Document: {doc.to_json_pretty()}")
 
     # Crypto Operations
     print("\nCrypto Operations (Sign/Verify)...")
     message = b"Hello HIDO Agents!"
     signature = did_manager.sign(did, message)
     print(f"✅ Signed Message: {message.decode()}")
-    print(f"   Signature (hex): {signature.hex()[:32]}...")
+    print(f"   Signature (hex): {signature[:16].hex()}...")
     
     valid = did_manager.verify(did, message, signature)
     print(f"✅ Signature Verified: {valid}")
@@ -42,21 +40,19 @@ def main():
     header("2. Semantic Intent (ICC)")
     
     print("Creating Complex Intent...")
-    intent = hido.Intent("analyze_dataset", "finance")
-    
-    # Fluent API
-    intent = (intent
-        .set_target("s3://data-lake/financial-records.csv")
-        .set_priority(2)  # High Priority
-        .add_param("format", "parquet")
-        .add_param("compression", "snappy")
+    intent = hido.Intent.new_full(
+        "analyze_dataset",
+        "finance",
+        target="s3://data-lake/financial-records.csv",
+        priority=hido.Intent.PRIORITY_HIGH,
+        params={"format": "parquet", "compression": "snappy"},
     )
     
-    intent_json = json.loads(intent.to_json())
     print(f"✅ Intent Created:")
     print(f"   ID: {intent.get_id}")
     print(f"   Action: {intent.get_action}")
-    print(f"   Details: {json.dumps(intent_json, indent=2)}")
+    print(f"   Details: {intent.to_json_pretty()}")
+    print(f"   Parameters: {intent.to_dict()['parameters']}")
 
     # ---------------------------------------------------------
     # 3. Flexible Audit Layer (BAL)
@@ -76,6 +72,13 @@ def main():
         )
         print(f"✅ Audit Entry Recorded!")
         print(f"   Entry ID: {entry_id}")
+
+        print("\nRecording Audit Batch...")
+        batch_ids = audit.record_batch([
+            (did, "read_schema", "s3://data-lake/financial-records.csv"),
+            (did, "export_report", "s3://reports/q4.pdf"),
+        ])
+        print(f"✅ Batch Recorded: {len(batch_ids)} entries")
         
     except Exception as e:
         print(f"❌ Audit Error: {e}")
@@ -82,6 +82,21 @@ pub trait AuditBackend: Send + Sync {
     /// Returns the unique entry ID on success.
     async fn record(&self, entry: AuditEntry) -> Result<EntryId>;
 
+    /// Record multiple audit entries.
+    ///
+    /// Returns entry IDs in input order. The default implementation
+    /// records entries one by one and is not atomic: if entry k fails,
+    /// entries before it stay recorded and only the error is returned.
+    /// Backends that can stage writes (locks, transactions) should
+    /// override this to record all entries or none.
+    async fn record_batch(&self, entries: Vec<AuditEntry>) -> Result<Vec<EntryId>> {
+        let mut ids = Vec::with_capacity(entries.len());
+        for entry in entries {
+            ids.push(self.record(entry).await?);
+        }
+        Ok(ids)
+    }
+
     /// Read an entry by ID.
     ///
     /// Returns None if entry doesn't exist.
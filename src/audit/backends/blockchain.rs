@@ -88,6 +88,21 @@ impl AuditBackend for BlockchainBackend {
         Ok(EntryId::new(&hash.to_hex()))
     }
 
+    async fn record_batch(&self, entries: Vec<AuditEntry>) -> Result<Vec<EntryId>> {
+        let actions = entries
+            .iter()
+            .map(|entry| (Self::entry_to_action(entry), entry.action.clone()))
+            .collect();
+
+        // Staged and appended under a single write lock; nothing is written on error
+        let hashes = {
+            let mut chain = self.chain.write().await;
+            chain.add_actions(&self.system_did, actions).await?
+        };
+
+        Ok(hashes.iter().map(|hash| EntryId::new(&hash.to_hex())).collect())
+    }
+
     async fn read(&self, id: &EntryId) -> Result<Option<AuditEntry>> {
         let chain = self.chain.read().await;
         
@@ -196,6 +211,26 @@ mod tests {
         assert!(read_entry.is_some());
     }
 
+    #[tokio::test]
+    async fn test_record_batch() {
+        let backend = BlockchainBackend::new(BlockchainConfig::default()).unwrap();
+
+        let initial = backend.count().await.unwrap();
+        let ids = backend
+            .record_batch(vec![
+                AuditEntry::new("agent-1", "execute", "task-1"),
+                AuditEntry::new("agent-2", "execute", "task-2"),
+            ])
+            .await
+            .unwrap();
+
+        assert_eq!(ids.len(), 2);
+        assert_eq!(backend.count().await.unwrap(), initial + 2);
+        for id in &ids {
+            assert!(backend.verify(id).await.unwrap().is_valid);
+        }
+    }
+
     #[tokio::test]
     async fn test_query() {
         let backend = BlockchainBackend::new(BlockchainConfig::default()).unwrap();
@@ -74,9 +74,56 @@ impl AgentBlockchain {
 
     /// Append a new action block to the chain.
     pub async fn append_block(&mut self, block: AgentActionBlock) -> Result<Hash256> {
-        // Verify block links to current head
-        let head = self.blocks.last().unwrap();
+        Self::check_link(self.blocks.last().unwrap(), &block)?;
+        Ok(self.push_block(block))
+    }
+
+    /// Create and append a new action.
+    pub async fn add_action(
+        &mut self,
+        agent: &DIDKey,
+        action: AgentAction,
+        reasoning: &str,
+    ) -> Result<Hash256> {
+        let parent_hash = self.head_hash().clone();
+        let height = self.height() + 1;
+
+        let block = AgentActionBlock::new(height, agent, action, parent_hash)?
+            .with_reasoning(reasoning);
+
+        self.append_block(block).await
+    }
+
+    /// Create and append several actions atomically.
+    ///
+    /// All blocks are built and validated before any is appended,
+    /// so on error the chain is left unchanged.
+    pub async fn add_actions(
+        &mut self,
+        agent: &DIDKey,
+        actions: Vec<(AgentAction, String)>,
+    ) -> Result<Vec<Hash256>> {
+        let mut staged: Vec<AgentActionBlock> = Vec::with_capacity(actions.len());
+
+        for (action, reasoning) in actions {
+            let parent = staged.last().unwrap_or_else(|| self.blocks.last().unwrap());
+            let block = AgentActionBlock::new(
+                parent.block_height + 1,
+                agent,
+                action,
+                parent.block_hash.clone(),
+            )?
+            .with_reasoning(&reasoning);
+
+            Self::check_link(parent, &block)?;
+            staged.push(block);
+        }
 
+        Ok(staged.into_iter().map(|block| self.push_block(block)).collect())
+    }
+
+    /// Check that a block correctly extends its parent.
+    fn check_link(head: &AgentActionBlock, block: &AgentActionBlock) -> Result<()> {
         if block.parent_hash != head.block_hash {
             return Err(Error::InvalidParentHash);
         }
@@ -98,7 +145,11 @@ impl AgentBlockchain {
             return Err(Error::BlockVerificationFailed("Block verification failed".into()));
         }
 
-        // Update metadata
+        Ok(())
+    }
+
+    /// Push a validated block and update metadata.
+    fn push_block(&mut self, block: AgentActionBlock) -> Hash256 {
         self.metadata.total_actions += 1;
         self.metadata.total_approvals += block.approvers.len() as u64;
         self.metadata.head_hash = block.block_hash.clone();
@@ -106,23 +157,7 @@ impl AgentBlockchain {
         let hash = block.block_hash.clone();
         self.blocks.push(block);
 
-        Ok(hash)
-    }
-
-    /// Create and append a new action.
-    pub async fn add_action(
-        &mut self,
-        agent: &DIDKey,
-        action: AgentAction,
-        reasoning: &str,
-    ) -> Result<Hash256> {
-        let parent_hash = self.head_hash().clone();
-        let height = self.height() + 1;
-
-        let block = AgentActionBlock::new(height, agent, action, parent_hash)?
-            .with_reasoning(reasoning);
-
-        self.append_block(block).await
+        hash
     }
 
     /// Get block by height.
@@ -282,6 +317,23 @@ mod tests {
         assert_eq!(chain.metadata.total_actions, 5);
     }
 
+    #[tokio::test]
+    async fn test_add_actions() {
+        let mut chain = AgentBlockchain::new().unwrap();
+        let agent = create_test_did();
+
+        let actions = (0..3)
+            .map(|i| (AgentAction::new("action", &format!("target_{}", i)), format!("Action {}", i)))
+            .collect();
+        let hashes = chain.add_actions(&agent, actions).await.unwrap();
+
+        assert_eq!(hashes.len(), 3);
+        assert_eq!(chain.height(), 3);
+        assert_eq!(chain.metadata.total_actions, 3);
+        assert_eq!(chain.head_hash(), &hashes[2]);
+        assert!(chain.verify_chain().unwrap().valid);
+    }
+
     #[tokio::test]
     async fn test_chain_verification() {
         let mut chain = AgentBlockchain::new().unwrap();
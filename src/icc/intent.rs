@@ -167,6 +167,11 @@ impl SemanticIntent {
         Ok(serde_json::to_string(self)?)
     }
 
+    /// Serialize to JSON as UTF-8 bytes.
+    pub fn to_json_vec(&self) -> Result<Vec<u8>> {
+        Ok(serde_json::to_vec(self)?)
+    }
+
     /// Deserialize from JSON.
     pub fn from_json(json: &str) -> Result<Self> {
         Ok(serde_json::from_str(json)?)
@@ -275,6 +280,16 @@ mod tests {
         assert_eq!(parsed.priority, IntentPriority::High);
     }
 
+    #[test]
+    fn test_intent_json_vec_matches_to_json() {
+        let sender = create_test_did();
+        let intent = SemanticIntent::new(&sender, IntentDomain::Data, "read")
+            .with_param("format", serde_json::json!("parquet"));
+
+        let bytes = intent.to_json_vec().unwrap();
+        assert_eq!(bytes, intent.to_json().unwrap().into_bytes());
+    }
+
     #[test]
     fn test_intent_binary_serialization() {
         let sender = create_test_did();
@@ -1,17 +1,57 @@
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyBytes};
+use pyo3::types::{PyDict, PyBytes, PyList};
 use crate::uail::{DIDManager, DIDConfig, DIDDocument};
 use crate::uail::crypto::CryptoSuite;
 use crate::uail::DIDKey;
 use crate::icc::intent::{SemanticIntent, IntentDomain, IntentPriority};
 use crate::audit::{AuditConfig, create_audit_backend, AuditBackend, AuditEntry, EntryId};
 use crate::audit::backend::BackendType; // Import BackendType
-use std::sync::Arc;
+use std::collections::HashMap;
+use std::sync::{Arc, OnceLock};
 use tokio::runtime::Runtime;
 
-// Helper runtime
-fn runtime() -> Runtime {
-    Runtime::new().unwrap()
+// Shared runtime, built once and reused by every binding call
+fn runtime() -> &'static Runtime {
+    static RUNTIME: OnceLock<Runtime> = OnceLock::new();
+    RUNTIME.get_or_init(|| {
+        tokio::runtime::Builder::new_multi_thread()
+            .thread_name("hido")
+            .enable_all()
+            .build()
+            .unwrap()
+    })
+}
+
+// Convert a serde_json value into native Python objects
+fn json_to_py(py: Python, value: &serde_json::Value) -> PyResult<PyObject> {
+    Ok(match value {
+        serde_json::Value::Null => py.None(),
+        serde_json::Value::Bool(b) => b.to_object(py),
+        serde_json::Value::Number(n) => {
+            if let Some(i) = n.as_i64() {
+                i.to_object(py)
+            } else if let Some(u) = n.as_u64() {
+                u.to_object(py)
+            } else {
+                n.as_f64().unwrap_or(f64::NAN).to_object(py)
+            }
+        }
+        serde_json::Value::String(s) => s.to_object(py),
+        serde_json::Value::Array(items) => {
+            let list = PyList::empty(py);
+            for item in items {
+                list.append(json_to_py(py, item)?)?;
+            }
+            list.into()
+        }
+        serde_json::Value::Object(map) => {
+            let dict = PyDict::new(py);
+            for (key, item) in map {
+                dict.set_item(key, json_to_py(py, item)?)?;
+            }
+            dict.into()
+        }
+    })
 }
 
 // --- DID Bindings ---
@@ -28,8 +68,20 @@ impl PyDIDDocument {
         self.inner.id.clone()
     }
 
-    fn to_json(&self) -> PyResult<String> {
-        serde_json::to_string(&self.inner).map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    fn to_json(&self, py: Python) -> PyResult<Py<PyBytes>> {
+        let json = serde_json::to_vec(&self.inner)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        Ok(PyBytes::new(py, &json).into())
+    }
+
+    fn to_json_pretty(&self) -> PyResult<String> {
+        serde_json::to_string_pretty(&self.inner).map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    fn to_dict(&self, py: Python) -> PyResult<PyObject> {
+        let value = serde_json::to_value(&self.inner)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        json_to_py(py, &value)
     }
 }
 
@@ -38,6 +90,8 @@ pub struct PyDIDManager {
     inner: DIDManager,
 }
 
+// DIDManager calls keep the GIL: generate takes &mut self, and releasing the
+// GIL during a pyclass borrow makes concurrent calls fail with "Already borrowed"
 #[pymethods]
 impl PyDIDManager {
     #[new]
@@ -78,8 +132,28 @@ pub struct PyIntent {
     inner: SemanticIntent,
 }
 
+impl PyIntent {
+    fn priority_from(priority: u8) -> IntentPriority {
+        match priority {
+            Self::PRIORITY_LOW => IntentPriority::Low,
+            Self::PRIORITY_NORMAL => IntentPriority::Normal,
+            Self::PRIORITY_HIGH => IntentPriority::High,
+            _ => IntentPriority::Critical,
+        }
+    }
+}
+
 #[pymethods]
 impl PyIntent {
+    #[classattr]
+    const PRIORITY_LOW: u8 = 0;
+    #[classattr]
+    const PRIORITY_NORMAL: u8 = 1;
+    #[classattr]
+    const PRIORITY_HIGH: u8 = 2;
+    #[classattr]
+    const PRIORITY_CRITICAL: u8 = 3;
+
     #[new]
     fn new(action: String, domain: Option<String>) -> Self {
         let crypto = CryptoSuite::new();
@@ -95,6 +169,24 @@ impl PyIntent {
         }
     }
 
+    #[staticmethod]
+    #[pyo3(signature = (action, domain=None, target=None, priority=1, params=None))]
+    fn new_full(
+        action: String,
+        domain: Option<String>,
+        target: Option<String>,
+        priority: u8,
+        params: Option<HashMap<String, String>>,
+    ) -> Self {
+        let mut intent = Self::new(action, domain);
+        intent.inner.target = target;
+        intent.inner.priority = Self::priority_from(priority);
+        for (key, value) in params.unwrap_or_default() {
+            intent.inner.parameters.insert(key, serde_json::Value::String(value));
+        }
+        intent
+    }
+
     #[getter]
     fn get_id(&self) -> String {
         self.inner.id.clone()
@@ -111,12 +203,7 @@ impl PyIntent {
     }
 
     fn set_priority(&mut self, priority: u8) -> Self {
-        self.inner.priority = match priority {
-            0 => IntentPriority::Low,
-            1 => IntentPriority::Normal,
-            2 => IntentPriority::High,
-            _ => IntentPriority::Critical,
-        };
+        self.inner.priority = Self::priority_from(priority);
         self.clone()
     }
 
@@ -126,13 +213,33 @@ impl PyIntent {
         self.clone()
     }
 
-    fn to_json(&self) -> PyResult<String> {
-        self.inner.to_json().map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    fn to_json(&self, py: Python) -> PyResult<Py<PyBytes>> {
+        let json = self.inner.to_json_vec()
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        Ok(PyBytes::new(py, &json).into())
+    }
+
+    fn to_json_pretty(&self) -> PyResult<String> {
+        serde_json::to_string_pretty(&self.inner).map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+    }
+
+    fn to_dict(&self, py: Python) -> PyResult<PyObject> {
+        let value = serde_json::to_value(&self.inner)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        json_to_py(py, &value)
     }
 }
 
 // --- Audit Bindings ---
 
+// Build an audit entry, rejecting empty fields before any backend work
+fn audit_entry(actor: &str, action: &str, target: &str) -> Result<AuditEntry, String> {
+    if actor.is_empty() || action.is_empty() || target.is_empty() {
+        return Err("actor, action and target must be non-empty".to_string());
+    }
+    Ok(AuditEntry::new(actor, action, target))
+}
+
 #[pyclass(name = "AuditBackend")]
 pub struct PyAuditBackend {
     inner: Arc<dyn AuditBackend>,
@@ -148,12 +255,24 @@ impl PyAuditBackend {
         Ok(PyAuditBackend { inner: backend })
     }
 
-    fn record(&self, actor: String, action: String, target: String) -> PyResult<String> {
-        let entry = AuditEntry::new(&actor, &action, &target);
-        let id = runtime().block_on(self.inner.record(entry))
+    fn record(&self, py: Python, actor: String, action: String, target: String) -> PyResult<String> {
+        let entry = audit_entry(&actor, &action, &target)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e))?;
+        let id = py.allow_threads(|| runtime().block_on(self.inner.record(entry)))
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
         Ok(id.as_str().to_string())
     }
+
+    fn record_batch(&self, py: Python, entries: Vec<(String, String, String)>) -> PyResult<Vec<String>> {
+        let entries = entries
+            .iter()
+            .map(|(actor, action, target)| audit_entry(actor, action, target))
+            .collect::<Result<Vec<_>, _>>()
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e))?;
+        let ids = py.allow_threads(|| runtime().block_on(self.inner.record_batch(entries)))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(ids.iter().map(|id| id.as_str().to_string()).collect())
+    }
     
     fn backend_type(&self) -> String {
         self.inner.backend_type().to_string()
@@ -170,3 +289,139 @@ fn hido(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<PyAuditBackend>()?;
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_audit_entry_valid() {
+        let entry = audit_entry("did:hido:agent", "execute", "task-1").unwrap();
+        assert_eq!(entry.actor, "did:hido:agent");
+        assert_eq!(entry.action, "execute");
+        assert_eq!(entry.target, "task-1");
+    }
+
+    #[test]
+    fn test_audit_entry_rejects_empty_fields() {
+        assert!(audit_entry("", "execute", "task-1").is_err());
+        assert!(audit_entry("agent-1", "", "task-1").is_err());
+        assert!(audit_entry("agent-1", "execute", "").is_err());
+    }
+
+    #[test]
+    fn test_set_priority() {
+        let mut intent = PyIntent::new("analyze".to_string(), None);
+
+        assert_eq!(intent.set_priority(PyIntent::PRIORITY_LOW).inner.priority, IntentPriority::Low);
+        assert_eq!(intent.set_priority(PyIntent::PRIORITY_NORMAL).inner.priority, IntentPriority::Normal);
+        assert_eq!(intent.set_priority(PyIntent::PRIORITY_HIGH).inner.priority, IntentPriority::High);
+        assert_eq!(intent.set_priority(PyIntent::PRIORITY_CRITICAL).inner.priority, IntentPriority::Critical);
+        assert_eq!(intent.set_priority(42).inner.priority, IntentPriority::Critical);
+    }
+
+    #[test]
+    fn test_json_to_py() {
+        pyo3::prepare_freethreaded_python();
+        let value = serde_json::json!({
+            "null": null,
+            "bool": true,
+            "int": -3,
+            "float": 1.5,
+            "string": "text",
+            "list": [1, "two"],
+        });
+
+        Python::with_gil(|py| {
+            let obj = json_to_py(py, &value).unwrap();
+            let dict: &PyDict = obj.as_ref(py).downcast().unwrap();
+
+            assert!(dict.get_item("null").unwrap().unwrap().is_none());
+            assert!(dict.get_item("bool").unwrap().unwrap().extract::<bool>().unwrap());
+            assert_eq!(dict.get_item("int").unwrap().unwrap().extract::<i64>().unwrap(), -3);
+            assert_eq!(dict.get_item("float").unwrap().unwrap().extract::<f64>().unwrap(), 1.5);
+            assert_eq!(dict.get_item("string").unwrap().unwrap().extract::<String>().unwrap(), "text");
+
+            let list: &PyList = dict.get_item("list").unwrap().unwrap().downcast().unwrap();
+            assert_eq!(list.len(), 2);
+            assert_eq!(list.get_item(0).unwrap().extract::<i64>().unwrap(), 1);
+            assert_eq!(list.get_item(1).unwrap().extract::<String>().unwrap(), "two");
+        });
+    }
+
+    #[test]
+    fn test_intent_to_dict() {
+        pyo3::prepare_freethreaded_python();
+        let intent = PyIntent::new("analyze".to_string(), None)
+            .add_param("format".to_string(), "parquet".to_string());
+
+        Python::with_gil(|py| {
+            let obj = intent.to_dict(py).unwrap();
+            let dict: &PyDict = obj.as_ref(py).downcast().unwrap();
+            assert_eq!(dict.get_item("action").unwrap().unwrap().extract::<String>().unwrap(), "analyze");
+
+            let params: &PyDict = dict.get_item("parameters").unwrap().unwrap().downcast().unwrap();
+            assert_eq!(params.get_item("format").unwrap().unwrap().extract::<String>().unwrap(), "parquet");
+        });
+    }
+
+    #[test]
+    fn test_did_document_to_dict() {
+        pyo3::prepare_freethreaded_python();
+        let mut manager = DIDManager::new(DIDConfig::default());
+        let did = runtime().block_on(manager.generate()).unwrap();
+        let doc = PyDIDDocument {
+            inner: runtime().block_on(manager.resolve(&did.id)).unwrap(),
+        };
+
+        Python::with_gil(|py| {
+            let obj = doc.to_dict(py).unwrap();
+            let dict: &PyDict = obj.as_ref(py).downcast().unwrap();
+            assert_eq!(dict.get_item("id").unwrap().unwrap().extract::<String>().unwrap(), did.id);
+        });
+    }
+
+    #[test]
+    fn test_intent_to_json_returns_bytes() {
+        pyo3::prepare_freethreaded_python();
+        let intent = PyIntent::new("analyze".to_string(), None);
+
+        Python::with_gil(|py| {
+            let json = intent.to_json(py).unwrap();
+            let bytes: &PyBytes = json.as_ref(py).downcast().unwrap();
+            let value: serde_json::Value = serde_json::from_slice(bytes.as_bytes()).unwrap();
+            assert_eq!(bytes.as_bytes(), intent.inner.to_json_vec().unwrap().as_slice());
+            assert_eq!(value, serde_json::to_value(&intent.inner).unwrap());
+        });
+    }
+
+    #[test]
+    fn test_new_full() {
+        let mut params = HashMap::new();
+        params.insert("format".to_string(), "parquet".to_string());
+
+        let intent = PyIntent::new_full(
+            "analyze".to_string(),
+            Some("finance".to_string()),
+            Some("s3://bucket/data.csv".to_string()),
+            PyIntent::PRIORITY_HIGH,
+            Some(params),
+        );
+
+        assert_eq!(intent.inner.action, "analyze");
+        assert_eq!(intent.inner.domain, IntentDomain::Custom("finance".to_string()));
+        assert_eq!(intent.inner.target.as_deref(), Some("s3://bucket/data.csv"));
+        assert_eq!(intent.inner.priority, IntentPriority::High);
+        assert_eq!(intent.inner.get_param::<String>("format").as_deref(), Some("parquet"));
+    }
+
+    #[test]
+    fn test_new_full_defaults() {
+        let intent = PyIntent::new_full("analyze".to_string(), None, None, PyIntent::PRIORITY_NORMAL, None);
+
+        assert_eq!(intent.inner.domain, IntentDomain::Data);
+        assert!(intent.inner.target.is_none());
+        assert_eq!(intent.inner.priority, IntentPriority::Normal);
+        assert!(intent.inner.parameters.is_empty());
+    }
+}